@@ -5,20 +5,14 @@ Add bidirectional connections to the map graph.
 Many portals in MapleStory work both ways, but the API only stores them
 in one direction. This script ensures that if map A connects to map B,
 then map B also connects back to map A (unless it already does).
+
+This is the last step of building a source's graph, after
+fetch_royals_library_data.py and filter_map_graph.py.
 """
-import json
-import os
+import argparse
 from typing import Dict, Set, Tuple
 
-def load_map_graph(path: str) -> Dict:
-    """Load the map graph JSON"""
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def save_map_graph(path: str, graph: Dict):
-    """Save the map graph JSON"""
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(graph, f, indent=2, ensure_ascii=False)
+from graph_store import get_source, load_graph, save_graph
 
 def add_bidirectional_connections(graph: Dict) -> Tuple[int, int]:
     """
@@ -133,8 +127,10 @@ def infer_reverse_portal_name(portal_name: str) -> str:
     return f"{portal_name}_reverse"
 
 def main():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    graph_path = os.path.join(script_dir, '..', 'public', 'map-graph.json')
+    parser = argparse.ArgumentParser(description="Add reverse portal connections to a map graph")
+    parser.add_argument("--source", help="Data source id from src/app/data/sources.json (default: the base source)")
+    args = parser.parse_args()
+    source_id, _ = get_source(args.source)
 
     print("=" * 80)
     print("Add Bidirectional Connections")
@@ -142,8 +138,8 @@ def main():
     print()
 
     # Load graph
-    print(f"Loading map graph from {graph_path}...")
-    graph = load_map_graph(graph_path)
+    print(f"Loading map graph for '{source_id}'...")
+    graph = load_graph(source_id)
     print(f"Loaded {len(graph)} maps\n")
 
     # Add bidirectional connections
@@ -159,9 +155,9 @@ def main():
     print()
 
     # Save updated graph
-    print(f"Saving updated graph to {graph_path}...")
-    save_map_graph(graph_path, graph)
-    print("✓ Done!")
+    print(f"Saving updated graph for '{source_id}'...")
+    graph_path = save_graph(graph, source_id)
+    print(f"✓ Saved to {graph_path}")
     print()
     print("You can now test pathfinding again.")
     print("Run: python scripts/debug_path.py 211000000 211040300")
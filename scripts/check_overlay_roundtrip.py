@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Check that overlays round-trip: applying the overlay computed for a graph
+onto the base gives back exactly that graph, in both the Python loader
+(graph_store.apply_overlay) and the app's loader (src/app/lib/graphOverlay.ts).
+
+The modified graph is derived from public/map-graph.json and covers added,
+removed and changed maps, added/removed/changed/reordered portals and maps
+with duplicate portal keys. The TypeScript check needs the project's
+node_modules (npm ci) and is skipped without them.
+
+It also loads the committed overlay of every non-base source, which fails
+if public/map-graph.json was changed without re-basing them.
+"""
+import copy
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+from graph_store import (
+    BASE_GRAPH_PATH,
+    PROJECT_ROOT,
+    apply_overlay,
+    check_overlay_base,
+    compute_overlay,
+    file_sha256,
+    index_portals,
+    is_base_source,
+    load_graph,
+    load_sources,
+    overlay_path,
+)
+
+# Transpiles graphOverlay.ts with the project's TypeScript and prints the
+# merge of the overlay onto the base as JSON
+TS_HARNESS = """
+const fs = require('fs')
+const ts = require('typescript')
+const [sourcePath, basePath, overlayPath, outPath] = process.argv.slice(1)
+const { outputText } = ts.transpileModule(fs.readFileSync(sourcePath, 'utf8'), {
+  compilerOptions: { module: ts.ModuleKind.CommonJS, target: ts.ScriptTarget.ES2017 },
+})
+const mod = { exports: {} }
+new Function('module', 'exports', 'require', outputText)(mod, mod.exports, require)
+const base = JSON.parse(fs.readFileSync(basePath, 'utf8'))
+const overlay = JSON.parse(fs.readFileSync(overlayPath, 'utf8'))
+fs.writeFileSync(outPath, JSON.stringify(mod.exports.applyOverlay(base, overlay)))
+"""
+
+
+def build_modified_graph(base: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive a graph from the base that exercises every kind of overlay entry"""
+    graph = copy.deepcopy(base)
+    with_portals = [k for k, v in graph.items() if len(v['connections']) >= 3 and index_portals(v['connections'])]
+    duplicate_keys = [k for k, v in graph.items() if index_portals(v['connections']) is None]
+
+    # Removed and added maps
+    for map_id in with_portals[:3]:
+        del graph[map_id]
+    graph['999999990'] = {'id': 999999990, 'name': 'Test Map', 'streetName': 'Test Street', 'connections': [
+        {'toMapId': int(with_portals[3]), 'portalName': 'out00', 'x': 0, 'y': 0},
+    ]}
+
+    # Changed names
+    graph[with_portals[4]]['name'] += ' (changed)'
+    graph[with_portals[5]]['streetName'] += ' (changed)'
+
+    # Added, removed, changed portals
+    graph[with_portals[6]]['connections'].append({'toMapId': 999999990, 'portalName': 'in00', 'x': 1, 'y': 2})
+    graph[with_portals[7]]['connections'].pop(1)
+    graph[with_portals[8]]['connections'][0]['x'] += 10
+
+    # Portal inserted at the front and a changed one: order must be kept
+    conns = graph[with_portals[9]]['connections']
+    conns.insert(0, {'toMapId': 999999990, 'portalName': 'in01', 'x': 3, 'y': 4})
+    conns[2]['y'] -= 10
+
+    # Reordered portals only
+    graph[with_portals[10]]['connections'].reverse()
+
+    # Maps with duplicate portal keys
+    graph[duplicate_keys[0]]['connections'][0]['x'] += 10
+    graph[duplicate_keys[1]]['connections'].append({'toMapId': 999999990, 'portalName': 'in02', 'x': 5, 'y': 6})
+    graph[duplicate_keys[2]]['name'] += ' (changed)'
+
+    return graph
+
+
+def check_typescript(base_path: Path, overlay: Dict[str, Any], expected: Dict[str, Any]) -> bool:
+    """Run graphOverlay.ts applyOverlay and compare with the Python result"""
+    source_path = PROJECT_ROOT / 'src' / 'app' / 'lib' / 'graphOverlay.ts'
+    if not (PROJECT_ROOT / 'node_modules' / 'typescript').exists():
+        print("⚠ Skipping TypeScript check (run npm ci first)")
+        return True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        overlay_path = Path(tmp) / 'overlay.json'
+        out_path = Path(tmp) / 'merged.json'
+        overlay_path.write_text(json.dumps(overlay), encoding='utf-8')
+        subprocess.run(
+            ['node', '-e', TS_HARNESS, str(source_path), str(base_path), str(overlay_path), str(out_path)],
+            cwd=PROJECT_ROOT,
+            check=True,
+        )
+        merged = json.loads(out_path.read_text(encoding='utf-8'))
+
+    if merged != expected:
+        print("✗ TypeScript applyOverlay differs from the Python result")
+        return False
+    print("✓ TypeScript applyOverlay matches the Python result")
+    return True
+
+
+def check_committed_overlays() -> bool:
+    """Load every non-base source's overlay against the current base"""
+    ok = True
+    for source_id in load_sources()['sources']:
+        if is_base_source(source_id):
+            continue
+
+        if not overlay_path(source_id).exists():
+            print(f"✗ No overlay for '{source_id}' at {overlay_path(source_id)}")
+            ok = False
+            continue
+
+        try:
+            load_graph(source_id)
+            print(f"✓ Overlay for '{source_id}' matches the base graph")
+        except ValueError as e:
+            print(f"✗ {e}")
+            ok = False
+    return ok
+
+
+def main():
+    base = json.loads(BASE_GRAPH_PATH.read_text(encoding='utf-8'))
+    base_snapshot = copy.deepcopy(base)
+    base_sha256 = file_sha256(BASE_GRAPH_PATH)
+
+    graph = build_modified_graph(base)
+    overlay = compute_overlay(base, graph, 'base', base_sha256)
+    merged = apply_overlay(base, overlay)
+
+    ok = True
+    if merged != graph:
+        bad = [k for k in set(merged) | set(graph) if merged.get(k) != graph.get(k)]
+        print(f"✗ Python round-trip differs for maps: {', '.join(sorted(bad))}")
+        ok = False
+    else:
+        print(f"✓ Python round-trip matches ({len(overlay['changed'])} changed, "
+              f"{len(overlay['added'])} added, {len(overlay['removed'])} removed maps)")
+
+    if base != base_snapshot:
+        print("✗ apply_overlay modified the base graph")
+        ok = False
+
+    try:
+        check_overlay_base(overlay, '0' * 64, BASE_GRAPH_PATH)
+        print("✗ Overlay with a mismatched base was accepted")
+        ok = False
+    except ValueError:
+        print("✓ Overlay with a mismatched base is rejected")
+
+    ok = check_typescript(BASE_GRAPH_PATH, overlay, merged) and ok
+    ok = check_committed_overlays() and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,19 +2,11 @@
 """
 Debug script to trace BFS pathfinding between two maps
 """
-import json
-import sys
+import argparse
 from collections import deque
 from typing import Dict, List, Set, Optional
 
-def load_map_graph(path: str = "../public/map-graph.json") -> Dict:
-    """Load the map graph JSON"""
-    import os
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    full_path = os.path.join(script_dir, path)
-
-    with open(full_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+from graph_store import get_source, load_graph
 
 def bfs_debug(graph: Dict, start_id: int, end_id: int, max_depth: int = 50) -> Optional[List[int]]:
     """
@@ -151,20 +143,21 @@ def bfs_debug(graph: Dict, start_id: int, end_id: int, max_depth: int = 50) -> O
     return None
 
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python debug_path.py <start_map_id> <end_map_id>")
-        print("Example: python debug_path.py 211000000 211040300")
-        sys.exit(1)
-
-    try:
-        start_id = int(sys.argv[1])
-        end_id = int(sys.argv[2])
-    except ValueError:
-        print("Error: Map IDs must be integers")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Trace BFS pathfinding between two maps",
+        epilog="Example: python debug_path.py 211000000 211040300",
+    )
+    parser.add_argument("start_id", type=int, help="Start map ID")
+    parser.add_argument("end_id", type=int, help="End map ID")
+    parser.add_argument("--source", help="Data source id from src/app/data/sources.json (default: the base source)")
+    args = parser.parse_args()
+
+    source_id, _ = get_source(args.source)
+    start_id = args.start_id
+    end_id = args.end_id
 
     print("Loading map graph...")
-    graph = load_map_graph()
+    graph = load_graph(source_id)
     print(f"Loaded {len(graph)} maps\n")
 
     path = bfs_debug(graph, start_id, end_id)
@@ -1,11 +1,20 @@
+"""
+Fetch map data for a data source and save it as its map graph.
+
+This is the first step of building a source's graph; run
+filter_map_graph.py and then add_bidirectional_connections.py with the
+same --source afterwards. Until then, an overlay source is diffed from the
+raw fetch against the filtered, bidirectional base and is much larger than
+it will end up.
+"""
+import argparse
 import requests
-import json
 import time
 from typing import Dict, List, Any
 
-BASE_URL = "https://royals-library.netlify.app/api/v1"
+from graph_store import get_source, save_graph
 
-def fetch_all_maps() -> List[Dict[str, Any]]:
+def fetch_all_maps(base_url: str) -> List[Dict[str, Any]]:
     """Fetch all maps from the Royals Library API with pagination"""
     all_maps = []
     page = 1
@@ -13,7 +22,7 @@ def fetch_all_maps() -> List[Dict[str, Any]]:
     while True:
         print(f"Fetching page {page}...")
         try:
-            response = requests.get(f"{BASE_URL}/map", params={"page": page}, timeout=10)
+            response = requests.get(f"{base_url}/map", params={"page": page}, timeout=10)
             
             if response.status_code != 200:
                 print(f"Error: {response.status_code}")
@@ -100,10 +109,10 @@ def build_map_graph(maps_with_details: List[Dict[str, Any]]) -> Dict[int, Dict[s
     
     return graph
 
-def fetch_map_details(map_id: int) -> Dict[str, Any]:
+def fetch_map_details(base_url: str, map_id: int) -> Dict[str, Any]:
     """Get detailed info for a specific map including portals"""
     try:
-        response = requests.get(f"{BASE_URL}/map", params={"id": map_id}, timeout=10)
+        response = requests.get(f"{base_url}/map", params={"id": map_id}, timeout=10)
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -111,11 +120,19 @@ def fetch_map_details(map_id: int) -> Dict[str, Any]:
     return None
 
 def main():
+    parser = argparse.ArgumentParser(description="Fetch map data for a data source")
+    parser.add_argument("--source", help="Data source id from src/app/data/sources.json (default: the base source)")
+    args = parser.parse_args()
+
+    source_id, source = get_source(args.source)
+    base_url = source['apiBaseUrl']
+
     print("=== Royals Library Map Data Fetcher ===\n")
+    print(f"Source: {source['label']} ({source_id}) - {base_url}\n")
 
     # Step 1: Fetch all maps list (basic info only)
     print("Step 1: Fetching all maps list...")
-    all_maps = fetch_all_maps()
+    all_maps = fetch_all_maps(base_url)
     print(f"\nTotal maps retrieved: {len(all_maps)}\n")
 
     if not all_maps:
@@ -142,7 +159,7 @@ def main():
         if i % 50 == 0 or i == 1:
             print(f"Progress: {i}/{total} maps ({i*100//total}%)")
 
-        details = fetch_map_details(map_id)
+        details = fetch_map_details(base_url, map_id)
         if details:
             detailed_maps.append(details)
 
@@ -166,17 +183,12 @@ def main():
     print(f"Total connections: {total_connections}")
     print(f"Average connections per map: {total_connections/len(graph):.2f}")
 
-    # Step 3: Save the graph to the public directory
-    import os
-    output_path = os.path.join(os.path.dirname(__file__), "..", "public", "map-graph.json")
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(graph, f, indent=2, ensure_ascii=False)
+    # Step 4: Save the graph (full graph for the base source, overlay otherwise)
+    output_path = save_graph({str(k): v for k, v in graph.items()}, source_id)
     print(f"\n✓ Successfully saved map graph to {output_path}")
 
     print("\n=== Done! ===")
-    print("The map-graph.json file has been updated in your project.")
+    print(f"The map graph for '{source_id}' has been updated in your project.")
 
 if __name__ == "__main__":
     main()
@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 """
-Filter out problematic map entries from map-graph.json:
+Filter out problematic map entries from a map graph:
 - Maps with Korean characters (including HTML-encoded)
 - Maps with quoted names
 - Maps with empty names or street names
+
+The graph is filtered in place for every source (the base graph or an
+overlay). Run it after fetch_royals_library_data.py and before
+add_bidirectional_connections.py, then review the result with git diff.
 """
 
-import json
+import argparse
 import re
-from pathlib import Path
+
+from graph_store import get_source, load_graph, save_graph
 
 def has_korean(text: str) -> bool:
     """Check if text contains Korean characters (Hangul)."""
@@ -55,17 +60,15 @@ def should_filter_out(map_data: dict, is_isolated: bool = False) -> bool:
     return False
 
 def main():
-    # Paths
-    project_root = Path(__file__).parent.parent
-    input_file = project_root / 'public' / 'map-graph.json'
-    output_file = project_root / 'public' / 'map-graph-filtered.json'
-    backup_file = project_root / 'public' / 'map-graph-backup.json'
+    parser = argparse.ArgumentParser(description="Filter problematic maps out of a map graph")
+    parser.add_argument("--source", help="Data source id from src/app/data/sources.json (default: the base source)")
+    args = parser.parse_args()
+    source_id, _ = get_source(args.source)
 
-    print(f"Loading map graph from {input_file}...")
+    print(f"Loading map graph for '{source_id}'...")
 
     # Load the map graph
-    with open(input_file, 'r', encoding='utf-8') as f:
-        map_graph = json.load(f)
+    map_graph = load_graph(source_id)
 
     original_count = len(map_graph)
     print(f"Original map count: {original_count}")
@@ -123,18 +126,12 @@ def main():
             for item in other_removed[:5]:
                 print(f"  ID: {item['id']:<12} Name: {item['name']:<35} Street: {item['streetName']}")
 
-    # Save backup of original
-    print(f"\nSaving backup to {backup_file}...")
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        json.dump(map_graph, f, ensure_ascii=False, indent=2)
-
     # Save filtered version
-    print(f"Saving filtered graph to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(filtered_graph, f, ensure_ascii=False, indent=2)
+    print(f"\nSaving filtered graph for '{source_id}'...")
+    output_file = save_graph(filtered_graph, source_id)
 
-    print("\n✅ Done! Review the filtered graph and replace the original if satisfied:")
-    print(f"   mv {output_file} {input_file}")
+    print(f"\n✅ Done! Saved filtered graph to {output_file}")
+    print("   Review the changes with git diff before committing.")
 
 if __name__ == '__main__':
     main()
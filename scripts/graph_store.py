@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Shared storage for map graphs across data sources (servers / versions).
+
+Most servers share almost all of their maps, so only the base source is
+stored as a full graph (public/map-graph.json). Every other source is
+stored as an overlay in public/overlays/<source>.json that records the
+maps and portals it adds, removes or changes relative to the base:
+
+    {
+      "base": "royals",
+      "baseSha256": "<sha256 of the map-graph.json it was built against>",
+      "added":   {"<mapId>": <MapNode>, ...},
+      "removed": ["<mapId>", ...],
+      "changed": {
+        "<mapId>": {
+          "name": "...",              # only present if it differs
+          "streetName": "...",        # only present if it differs
+          "portals": {                # only present if connections differ
+            "added":   [<connection>, ...],
+            "removed": [[portalName, toMapId], ...],
+            "changed": [<connection>, ...]
+          }
+        }
+      }
+    }
+
+Portals are identified by (portalName, toMapId). If a map has duplicate
+portal keys, or the patch would not reproduce the portal order (the
+pathfinder returns the first route it finds, so order matters), the
+overlay stores the full "connections" list instead of a portal patch.
+
+An overlay is only valid for the exact base file it was diffed against.
+Loading an overlay whose baseSha256 doesn't match fails, and saving the
+base re-bases every existing overlay so the other sources keep their data.
+
+Every source is built in place with the same steps, in this order:
+
+    python fetch_royals_library_data.py [--source X]
+    python filter_map_graph.py [--source X]
+    python add_bidirectional_connections.py [--source X]
+
+Until all three have run for X its overlay also contains the maps the
+filter removes and the reverse portals the last step adds to the base.
+Review the result with git diff before committing.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SOURCES_PATH = PROJECT_ROOT / 'src' / 'app' / 'data' / 'sources.json'
+BASE_GRAPH_PATH = PROJECT_ROOT / 'public' / 'map-graph.json'
+OVERLAY_DIR = PROJECT_ROOT / 'public' / 'overlays'
+
+PortalKey = Tuple[str, int]
+
+
+def load_sources() -> Dict[str, Any]:
+    """Load the data source manifest shared with the app"""
+    with open(SOURCES_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def get_source(source_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+    """Resolve a source id (defaults to the base source) to (id, config)"""
+    manifest = load_sources()
+    source_id = source_id or manifest['base']
+    if source_id not in manifest['sources']:
+        known = ', '.join(sorted(manifest['sources']))
+        raise ValueError(f"Unknown data source '{source_id}' (known: {known})")
+    return source_id, manifest['sources'][source_id]
+
+
+def is_base_source(source_id: str) -> bool:
+    return source_id == load_sources()['base']
+
+
+def overlay_path(source_id: str) -> Path:
+    return OVERLAY_DIR / f"{source_id}.json"
+
+
+def _read_json(path: Path) -> Any:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def check_overlay_base(overlay: Dict[str, Any], base_sha256: str, path: Path):
+    """Raise if the overlay was not built against the given base"""
+    if overlay.get('baseSha256') != base_sha256:
+        raise ValueError(
+            f"Overlay {path} was built against a different {BASE_GRAPH_PATH.name} "
+            f"(overlay: {overlay.get('baseSha256')}, current: {base_sha256}). "
+            f"Restore the matching base graph, e.g. with git checkout."
+        )
+
+
+def _portal_key(conn: Dict[str, Any]) -> PortalKey:
+    return (conn['portalName'], conn['toMapId'])
+
+
+def index_portals(connections: List[Dict[str, Any]]) -> Optional[Dict[PortalKey, Dict[str, Any]]]:
+    """Index connections by portal key, or None if keys are not unique"""
+    index = {}
+    for conn in connections:
+        key = _portal_key(conn)
+        if key in index:
+            return None
+        index[key] = conn
+    return index
+
+
+def diff_connections(base_conns: List[Dict[str, Any]], conns: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Compute a portal patch turning base_conns into conns.
+    Returns None if the lists are identical.
+    """
+    if base_conns == conns:
+        return None
+
+    base_index = index_portals(base_conns)
+    index = index_portals(conns)
+    if base_index is None or index is None:
+        return {'connections': conns}
+
+    patch = {
+        'added': [c for k, c in index.items() if k not in base_index],
+        'removed': [list(k) for k in base_index if k not in index],
+        'changed': [c for k, c in index.items() if k in base_index and base_index[k] != c],
+    }
+    patch = {k: v for k, v in patch.items() if v}
+    # The patch appends added portals, so it can't express every reordering
+    if apply_connections(base_conns, patch) != conns:
+        return {'connections': conns}
+    return {'portals': patch}
+
+
+def apply_connections(base_conns: List[Dict[str, Any]], patch: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Apply a portal patch, returning a new connections list"""
+    removed = {(pn, to) for pn, to in patch.get('removed', [])}
+    changed = {_portal_key(c): c for c in patch.get('changed', [])}
+
+    result = []
+    for conn in base_conns:
+        key = _portal_key(conn)
+        if key in removed:
+            continue
+        result.append(changed.get(key, conn))
+    result.extend(patch.get('added', []))
+    return result
+
+
+def compute_overlay(base: Dict[str, Any], graph: Dict[str, Any], base_id: str, base_sha256: str) -> Dict[str, Any]:
+    """Compute the overlay that turns the base graph into graph"""
+    added = {k: v for k, v in graph.items() if k not in base}
+    removed = [k for k in base if k not in graph]
+    changed = {}
+
+    for map_id, node in graph.items():
+        base_node = base.get(map_id)
+        if base_node is None or base_node == node:
+            continue
+
+        delta = {}
+        for field in ('name', 'streetName'):
+            if node.get(field) != base_node.get(field):
+                delta[field] = node.get(field)
+
+        conn_delta = diff_connections(base_node['connections'], node['connections'])
+        if conn_delta:
+            delta.update(conn_delta)
+
+        changed[map_id] = delta
+
+    return {
+        'base': base_id,
+        'baseSha256': base_sha256,
+        'added': added,
+        'removed': removed,
+        'changed': changed,
+    }
+
+
+def apply_overlay(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge an overlay onto the base graph (copy-on-write).
+
+    The base is never modified: untouched map nodes are shared between the
+    base and the result, only changed nodes are copied. Callers that mutate
+    nodes in place should save through save_graph, which diffs against a
+    fresh copy of the base.
+    """
+    graph = dict(base)
+
+    for map_id in overlay.get('removed', []):
+        graph.pop(map_id, None)
+
+    for map_id, delta in overlay.get('changed', {}).items():
+        base_node = base.get(map_id)
+        if base_node is None:
+            continue
+
+        node = dict(base_node)
+        for field in ('name', 'streetName'):
+            if field in delta:
+                node[field] = delta[field]
+
+        if 'connections' in delta:
+            node['connections'] = delta['connections']
+        elif 'portals' in delta:
+            node['connections'] = apply_connections(base_node['connections'], delta['portals'])
+
+        graph[map_id] = node
+
+    graph.update(overlay.get('added', {}))
+    return graph
+
+
+def load_graph(source_id: Optional[str] = None) -> Dict[str, Any]:
+    """Load the full graph for a data source"""
+    source_id, _ = get_source(source_id)
+    base = _read_json(BASE_GRAPH_PATH)
+    if is_base_source(source_id):
+        return base
+
+    path = overlay_path(source_id)
+    if not path.exists():
+        print(f"Warning: no overlay for '{source_id}' at {path}, using the base graph")
+        return base
+
+    overlay = _read_json(path)
+    check_overlay_base(overlay, file_sha256(BASE_GRAPH_PATH), path)
+    return apply_overlay(base, overlay)
+
+
+def _save_base_graph(graph: Dict[str, Any]):
+    """
+    Overwrite the base graph and re-base every existing overlay onto it.
+    Each overlay is materialized against the old base first, so the other
+    sources keep exactly the data they had.
+    """
+    materialized = {}
+    if BASE_GRAPH_PATH.exists() and OVERLAY_DIR.exists():
+        old_base = _read_json(BASE_GRAPH_PATH)
+        old_sha256 = file_sha256(BASE_GRAPH_PATH)
+        for path in sorted(OVERLAY_DIR.glob('*.json')):
+            overlay = _read_json(path)
+            # Refuse to touch anything if an overlay is already stale
+            check_overlay_base(overlay, old_sha256, path)
+            materialized[path] = apply_overlay(old_base, overlay)
+
+    _write_json(BASE_GRAPH_PATH, graph)
+    if not materialized:
+        return
+
+    new_base = _read_json(BASE_GRAPH_PATH)
+    new_sha256 = file_sha256(BASE_GRAPH_PATH)
+    base_id = load_sources()['base']
+    for path, source_graph in materialized.items():
+        _write_json(path, compute_overlay(new_base, source_graph, base_id, new_sha256))
+        print(f"Re-based overlay {path}")
+
+
+def save_graph(graph: Dict[str, Any], source_id: Optional[str] = None) -> Path:
+    """
+    Save the full graph for a data source.
+    The base source is written as-is (re-basing existing overlays), other
+    sources as an overlay. Returns the path that was written.
+    """
+    source_id, _ = get_source(source_id)
+    if is_base_source(source_id):
+        _save_base_graph(graph)
+        return BASE_GRAPH_PATH
+
+    # Re-read the base so in-place edits to shared nodes don't hide changes
+    base = _read_json(BASE_GRAPH_PATH)
+    overlay = compute_overlay(base, graph, load_sources()['base'], file_sha256(BASE_GRAPH_PATH))
+    path = overlay_path(source_id)
+    _write_json(path, overlay)
+    return path
@@ -12,17 +12,18 @@ import {
   CommandItem,
   CommandList,
 } from '@/components/ui/command'
-import { MapInfo, getMapIconUrl } from '../types/map'
+import { DataSource, MapInfo, getMapIconUrl } from '../types/map'
 import { useDebounce } from '../hooks/useDebounce'
 
 interface MapSearchProps {
   maps: MapInfo[]
   value: MapInfo | null
   onSelect: (map: MapInfo | null) => void
+  source: DataSource
   placeholder?: string
 }
 
-export function MapSearch({ maps, value, onSelect, placeholder = 'Type to search maps...' }: MapSearchProps) {
+export function MapSearch({ maps, value, onSelect, source, placeholder = 'Type to search maps...' }: MapSearchProps) {
   const [open, setOpen] = React.useState(false)
   const [searchQuery, setSearchQuery] = React.useState('')
   const [isEditing, setIsEditing] = React.useState(false)
@@ -163,7 +164,7 @@ export function MapSearch({ maps, value, onSelect, placeholder = 'Type to search
                   >
                     {/* eslint-disable-next-line @next/next/no-img-element */}
                     <img
-                      src={getMapIconUrl(map.id)}
+                      src={getMapIconUrl(map.id, source)}
                       alt=""
                       className="mr-2 h-6 w-6 shrink-0 object-contain"
                       onError={(e) => {
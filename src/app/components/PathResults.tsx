@@ -1,6 +1,6 @@
 'use client'
 
-import { PathStep, getMapImageUrl, getMapIconUrl } from '../types/map'
+import { DataSource, PathStep, getMapImageUrl, getMapIconUrl } from '../types/map'
 import { Card, CardContent } from '@/components/ui/card'
 import { ArrowRight, ArrowLeft, ArrowUp, ArrowDown, ChevronLeft, ChevronRight } from 'lucide-react'
 import Zoom from 'react-medium-image-zoom'
@@ -12,6 +12,7 @@ import { PathTimeline } from './PathTimeline'
 
 interface PathResultsProps {
   path: PathStep[]
+  source: DataSource
 }
 
 const DirectionIcon = ({ direction }: { direction: string }) => {
@@ -31,7 +32,7 @@ const DirectionIcon = ({ direction }: { direction: string }) => {
   }
 }
 
-export function PathResults({ path }: PathResultsProps) {
+export function PathResults({ path, source }: PathResultsProps) {
   const [emblaRef, emblaApi] = useEmblaCarousel({ loop: false, align: 'start', skipSnaps: true }, [WheelGesturesPlugin({ forceWheelAxis: 'y' })])
   const [selectedIndex, setSelectedIndex] = useState(0)
 
@@ -133,7 +134,7 @@ export function PathResults({ path }: PathResultsProps) {
                       <div className="flex items-center gap-2 flex-wrap">
                         {/* eslint-disable-next-line @next/next/no-img-element */}
                         <img
-                          src={getMapIconUrl(step.currentMap.id)}
+                          src={getMapIconUrl(step.currentMap.id, source)}
                           alt=""
                           className="h-5 w-5 shrink-0 object-contain"
                           onError={(e) => {
@@ -146,7 +147,7 @@ export function PathResults({ path }: PathResultsProps) {
                         <ArrowRight className="h-4 w-4 text-muted-foreground" />
                         {/* eslint-disable-next-line @next/next/no-img-element */}
                         <img
-                          src={getMapIconUrl(step.nextMap.id)}
+                          src={getMapIconUrl(step.nextMap.id, source)}
                           alt=""
                           className="h-5 w-5 shrink-0 object-contain"
                           onError={(e) => {
@@ -176,7 +177,7 @@ export function PathResults({ path }: PathResultsProps) {
                         <Zoom>
                           {/* eslint-disable-next-line @next/next/no-img-element */}
                           <img
-                            src={getMapImageUrl(step.currentMap.id)}
+                            src={getMapImageUrl(step.currentMap.id, source)}
                             alt={step.currentMap.name || `Map ${step.currentMap.id}`}
                             className="max-h-[600px] max-w-full w-auto h-auto object-contain"
                             loading="lazy"
@@ -227,7 +228,7 @@ export function PathResults({ path }: PathResultsProps) {
               <div className="flex items-center gap-2 mb-1 flex-wrap">
                 {/* eslint-disable-next-line @next/next/no-img-element */}
                 <img
-                  src={getMapIconUrl(path[path.length - 1].nextMap.id)}
+                  src={getMapIconUrl(path[path.length - 1].nextMap.id, source)}
                   alt=""
                   className="h-5 w-5 shrink-0 object-contain"
                   onError={(e) => {
@@ -249,7 +250,7 @@ export function PathResults({ path }: PathResultsProps) {
                 <Zoom>
                   {/* eslint-disable-next-line @next/next/no-img-element */}
                   <img
-                    src={getMapImageUrl(path[path.length - 1].nextMap.id)}
+                    src={getMapImageUrl(path[path.length - 1].nextMap.id, source)}
                     alt={path[path.length - 1].nextMap.name || `Map ${path[path.length - 1].nextMap.id}`}
                     className="max-h-[600px] max-w-full w-auto h-auto object-contain"
                     loading="lazy"
@@ -0,0 +1,18 @@
+import sources from '../data/sources.json'
+import type { DataSource } from '../types/map'
+
+// Shared with the Python data scripts (scripts/graph_store.py)
+export const BASE_SOURCE_ID: string = sources.base
+
+export const DATA_SOURCES: DataSource[] = Object.entries(sources.sources).map(([id, source]) => ({
+  id,
+  ...source,
+}))
+
+// Falls back to the base source for unknown or missing ids
+export function getDataSource(id?: string | null): DataSource {
+  return (
+    DATA_SOURCES.find((source) => source.id === id) ??
+    DATA_SOURCES.find((source) => source.id === BASE_SOURCE_ID)!
+  )
+}
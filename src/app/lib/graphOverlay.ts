@@ -0,0 +1,48 @@
+import type { GraphConnection, GraphOverlay, MapGraph, PortalPatch } from '../types/map'
+
+function portalKey(portalName: string, toMapId: number): string {
+  return `${portalName}\u0000${toMapId}`
+}
+
+function applyPortalPatch(baseConnections: GraphConnection[], patch: PortalPatch): GraphConnection[] {
+  const removed = new Set((patch.removed ?? []).map(([portalName, toMapId]) => portalKey(portalName, toMapId)))
+  const changed = new Map((patch.changed ?? []).map((c) => [portalKey(c.portalName, c.toMapId), c]))
+
+  const result: GraphConnection[] = []
+  for (const connection of baseConnections) {
+    const key = portalKey(connection.portalName, connection.toMapId)
+    if (removed.has(key)) continue
+    result.push(changed.get(key) ?? connection)
+  }
+  result.push(...(patch.added ?? []))
+  return result
+}
+
+// Merge a server overlay onto the base graph (copy-on-write).
+// The base graph is left untouched; unchanged nodes are shared and only
+// changed nodes are copied, so the cost scales with the overlay size.
+export function applyOverlay(base: MapGraph, overlay: GraphOverlay): MapGraph {
+  const graph: MapGraph = { ...base }
+
+  for (const mapId of overlay.removed) {
+    delete graph[mapId]
+  }
+
+  for (const [mapId, delta] of Object.entries(overlay.changed)) {
+    const baseNode = base[mapId]
+    if (!baseNode) continue
+
+    const node = { ...baseNode }
+    if (delta.name !== undefined) node.name = delta.name
+    if (delta.streetName !== undefined) node.streetName = delta.streetName
+    if (delta.connections) {
+      node.connections = delta.connections
+    } else if (delta.portals) {
+      node.connections = applyPortalPatch(baseNode.connections, delta.portals)
+    }
+    graph[mapId] = node
+  }
+
+  Object.assign(graph, overlay.added)
+  return graph
+}
@@ -1,24 +1,91 @@
-import type { MapGraph, MapInfo, PathStep } from '../types/map'
+import type { GraphOverlay, MapGraph, MapInfo, PathStep } from '../types/map'
+import { BASE_SOURCE_ID, getDataSource } from './dataSources'
+import { applyOverlay } from './graphOverlay'
 
 let mapGraph: MapGraph | null = null
+let baseGraphPromise: Promise<MapGraph> | null = null
+let baseSha256Promise: Promise<string> | null = null
+const graphCache = new Map<string, MapGraph>()
 
-export async function initializePathfinding() {
-  if (!mapGraph) {
-    try {
-      console.log('Loading map data...')
-      const graphResponse = await fetch('/map-graph.json')
+const BASE_GRAPH_URL = '/map-graph.json'
 
-      if (!graphResponse.ok) {
-        throw new Error(`Failed to load map graph data: ${graphResponse.status} ${graphResponse.statusText}`)
-      }
+async function fetchChecked(url: string, label: string): Promise<Response> {
+  const response = await fetch(url)
+
+  if (!response.ok) {
+    throw new Error(`Failed to load ${label}: ${response.status} ${response.statusText}`)
+  }
+
+  return response
+}
+
+async function fetchJson<T>(url: string, label: string): Promise<T> {
+  const response = await fetchChecked(url, label)
+  return response.json()
+}
+
+// The base graph is shared by every server, so it is only downloaded once
+function loadBaseGraph(): Promise<MapGraph> {
+  if (!baseGraphPromise) {
+    baseGraphPromise = fetchJson<MapGraph>(BASE_GRAPH_URL, 'map graph data')
+    baseGraphPromise.catch(() => {
+      baseGraphPromise = null
+    })
+  }
+  return baseGraphPromise
+}
 
-      mapGraph = await graphResponse.json()
-      const nodeCount = mapGraph ? Object.keys(mapGraph).length : 0
-      console.log(`Loaded map graph with ${nodeCount} nodes`)
-    } catch (error) {
-      console.error('Error loading map graph:', error)
-      throw error
+async function fetchBaseSha256(): Promise<string> {
+  // crypto.subtle only exists in secure contexts (HTTPS or localhost)
+  if (!globalThis.crypto?.subtle) {
+    throw new Error('Other servers can only be loaded over HTTPS or localhost (needed to verify the map graph)')
+  }
+
+  const response = await fetchChecked(BASE_GRAPH_URL, 'map graph data')
+  const digest = await crypto.subtle.digest('SHA-256', await response.arrayBuffer())
+  return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0')).join('')
+}
+
+// Identifies which base an overlay was built against, so it is only
+// computed when an overlay is requested
+function loadBaseSha256(): Promise<string> {
+  if (!baseSha256Promise) {
+    baseSha256Promise = fetchBaseSha256()
+    baseSha256Promise.catch(() => {
+      baseSha256Promise = null
+    })
+  }
+  return baseSha256Promise
+}
+
+export async function initializePathfinding(sourceId: string = BASE_SOURCE_ID) {
+  const source = getDataSource(sourceId)
+  const cached = graphCache.get(source.id)
+  if (cached) {
+    mapGraph = cached
+    return mapGraph
+  }
+
+  try {
+    console.log(`Loading map data for ${source.label}...`)
+    let graph = await loadBaseGraph()
+    if (source.id !== BASE_SOURCE_ID) {
+      const [overlay, baseSha256] = await Promise.all([
+        fetchJson<GraphOverlay>(`/overlays/${source.id}.json`, `${source.label} overlay`),
+        loadBaseSha256(),
+      ])
+      if (overlay.baseSha256 !== baseSha256) {
+        throw new Error(`${source.label} overlay was built against a different base map graph`)
+      }
+      graph = applyOverlay(graph, overlay)
     }
+
+    graphCache.set(source.id, graph)
+    mapGraph = graph
+    console.log(`Loaded map graph with ${Object.keys(mapGraph).length} nodes`)
+  } catch (error) {
+    console.error('Error loading map graph:', error)
+    throw error
   }
   return mapGraph
 }
@@ -10,6 +10,7 @@ import { Button } from '@/components/ui/button'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { MapInfo, PathStep, MapGraph } from './types/map'
 import { initializePathfinding } from './lib/pathfinding'
+import { BASE_SOURCE_ID, getDataSource } from './lib/dataSources'
 import { usePathfindingWorker } from './hooks/usePathfindingWorker'
 import { Loader2, ArrowLeftRight, X } from 'lucide-react'
 
@@ -28,10 +29,13 @@ function HomeContent() {
 
   const { findPath, cancelSearch } = usePathfindingWorker()
 
+  // Server / version to route on, e.g. ?server=royals (defaults to the base source)
+  const source = getDataSource(searchParams.get('server'))
+
   useEffect(() => {
     async function init() {
       try {
-        const graph = await initializePathfinding()
+        const graph = await initializePathfinding(source.id)
         setMapGraph(graph)
 
         // Convert map graph to array of MapInfo
@@ -49,19 +53,13 @@ function HomeContent() {
         setMaps(namedMaps)
         setInitialized(true)
 
-        // Read URL parameters and set maps if present
+        // Read URL parameters and resolve them against this server's maps,
+        // so a map picked on another server doesn't stay selected
         const startId = searchParams.get('start')
         const endId = searchParams.get('end')
 
-        if (startId) {
-          const start = namedMaps.find(m => m.id === parseInt(startId))
-          if (start) setStartMap(start)
-        }
-
-        if (endId) {
-          const end = namedMaps.find(m => m.id === parseInt(endId))
-          if (end) setEndMap(end)
-        }
+        setStartMap(startId ? namedMaps.find(m => m.id === parseInt(startId)) ?? null : null)
+        setEndMap(endId ? namedMaps.find(m => m.id === parseInt(endId)) ?? null : null)
       } catch (err) {
         setError('Failed to load map data')
         console.error(err)
@@ -69,11 +67,17 @@ function HomeContent() {
     }
 
     init()
-  }, [searchParams])
+  }, [searchParams, source.id])
+
+  // A path found on another server doesn't apply to this one
+  useEffect(() => {
+    setPath(null)
+  }, [source.id])
 
   // Update URL with current map selections
   const updateUrl = (start: MapInfo | null, end: MapInfo | null) => {
     const params = new URLSearchParams()
+    if (source.id !== BASE_SOURCE_ID) params.set('server', source.id)
     if (start) params.set('start', start.id.toString())
     if (end) params.set('end', end.id.toString())
 
@@ -160,6 +164,7 @@ function HomeContent() {
                   maps={maps}
                   value={startMap}
                   onSelect={handleStartMapChange}
+                  source={source}
                   placeholder="Select starting map..."
                 />
               </div>
@@ -181,6 +186,7 @@ function HomeContent() {
                   maps={maps}
                   value={endMap}
                   onSelect={handleEndMapChange}
+                  source={source}
                   placeholder="Select destination map..."
                 />
               </div>
@@ -228,7 +234,7 @@ function HomeContent() {
         </Card>
 
         {/* Results */}
-        {path !== null && <PathResults path={path} />}
+        {path !== null && <PathResults path={path} source={source} />}
       </main>
 
       {/* Footer */}
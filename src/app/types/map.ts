@@ -36,6 +36,36 @@ export interface MapGraph {
   [mapId: string]: MapNode
 }
 
+// Per-server delta against the base graph (see scripts/graph_store.py)
+export interface PortalPatch {
+  added?: GraphConnection[]
+  removed?: [string, number][] // [portalName, toMapId]
+  changed?: GraphConnection[]
+}
+
+export interface MapNodeDelta {
+  name?: string
+  streetName?: string
+  portals?: PortalPatch
+  connections?: GraphConnection[]
+}
+
+export interface GraphOverlay {
+  base: string
+  baseSha256: string // sha256 of the map-graph.json the overlay was built against
+  added: MapGraph
+  removed: string[]
+  changed: { [mapId: string]: MapNodeDelta }
+}
+
+export interface DataSource {
+  id: string
+  label: string
+  apiBaseUrl: string
+  region: string
+  version: string
+}
+
 export interface PathStep {
   currentMap: MapInfo
   nextMap: MapInfo
@@ -44,11 +74,11 @@ export interface PathStep {
 }
 
 // Utility function to generate map image URL
-export function getMapImageUrl(mapId: number): string {
-  return `https://maplestory.io/api/GMS/83/map/${mapId}/render`
+export function getMapImageUrl(mapId: number, source: DataSource): string {
+  return `https://maplestory.io/api/${source.region}/${source.version}/map/${mapId}/render`
 }
 
 // Utility function to generate map icon URL
-export function getMapIconUrl(mapId: number): string {
-  return `https://maplestory.io/api/GMS/83/map/${mapId}/icon`
+export function getMapIconUrl(mapId: number, source: DataSource): string {
+  return `https://maplestory.io/api/${source.region}/${source.version}/map/${mapId}/icon`
 }